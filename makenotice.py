@@ -8,21 +8,20 @@ Based on RBI IFSC code structure:
 - Last 6 characters: Branch code (numeric/alphanumeric)
 """
 
-import pandas as pd
-from docx import Document
-from docx.shared import Pt
-from docx.shared import RGBColor
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT, WD_ALIGN_VERTICAL, WD_ROW_HEIGHT_RULE
 import argparse
+import copy
+import csv
+import functools
+import hashlib
 import os
-from collections import defaultdict
+import re
+import zipfile
+from io import BytesIO
+from types import MappingProxyType
 
 # Comprehensive IFSC to Bank Name mapping based on RBI specifications
-# First 4 characters of IFSC identify the bank
-IFSC_BANK_MAP = {
+# First 4 characters of IFSC identify the bank (read-only)
+IFSC_BANK_MAP = MappingProxyType({
     # Public Sector Banks
     'SBIN': 'STATE BANK OF INDIA',
     'ALLA': 'ALLAHABAD BANK',
@@ -91,7 +90,10 @@ IFSC_BANK_MAP = {
     'NSPB': 'NSDL PAYMENTS BANK',
     'PAYU': 'PAYU PAYMENTS PRIVATE LIMITED',
     'PYTM': 'PAYTM PAYMENTS BANK',
-}
+})
+
+# IFSC format: 4 alphabetic + '0' + 6 alphanumeric
+_IFSC_RE = re.compile(r'[A-Z]{4}0[A-Z0-9]{6}')
 
 def get_bank_name(ifsc_code):
     """
@@ -100,103 +102,118 @@ def get_bank_name(ifsc_code):
     - First 4 characters (XXXX): Bank identifier
     - 5th character: Always '0'
     - Last 6 characters (YYYYYY): Branch code
+    Unknown bank codes fall back to a generic name with the bank code
     """
-    if not ifsc_code or len(ifsc_code) < 4:
-        return f"UNKNOWN BANK ({ifsc_code})"
-    
-    bank_code = ifsc_code[:4].upper()
-    bank_name = IFSC_BANK_MAP.get(bank_code)
-    
-    if bank_name:
-        return bank_name
-    else:
-        # Return a generic name with the bank code if not found in our map
-        return f"{bank_code} BANK"
+    return _bank_name_from_prefix(ifsc_code[:4].upper())
+
+@functools.lru_cache(maxsize=4096)
+def _bank_name_from_prefix(bank_code):
+    return IFSC_BANK_MAP.get(bank_code) or f"{bank_code} BANK"
+
+@functools.lru_cache(maxsize=256)
+def _safe_bank_token(bank_name):
+    """Bank name as used in output file names"""
+    return bank_name.replace(' ', '_')
 
 def validate_ifsc(ifsc_code):
     """
     Validate IFSC code format
     Should be 11 characters: 4 alphabetic + 0 + 6 alphanumeric
     """
-    if len(ifsc_code) != 11:
-        return False
-    
-    # First 4 should be alphabetic
-    if not ifsc_code[:4].isalpha():
-        return False
-    
-    # 5th should be 0
-    if ifsc_code[4] != '0':
-        return False
-    
-    # Last 6 can be alphanumeric
-    if not ifsc_code[5:].isalnum():
-        return False
-    
-    return True
+    return bool(_IFSC_RE.fullmatch(ifsc_code))
+
+# Header patterns for the required columns, tried in order against the
+# lowercased header; a column is claimed by the first kind it matches
+_COL_PATTERNS = {
+    'account': re.compile(r'(?!.*name)(?:(?=.*account)(?=.*(?:number|no|#))|.*(?:a/c|ac no|acc no|acno))', re.S),
+    'name': re.compile(r'(?=.*account)(?=.*name)|(?=.*name)(?=.*(?:beneficiary|holder))|(?=.*account)(?=.*holder)', re.S),
+    'ifsc': re.compile(r'.*ifsc', re.S),
+}
+
+def _detect_columns(columns):
+    """Find the account number, account name and IFSC columns (flexible naming)"""
+    resolved = {}
+    for col in columns:
+        col_lower = col.lower()
+        for kind, pattern in _COL_PATTERNS.items():
+            if pattern.match(col_lower):
+                resolved.setdefault(kind, col)
+                break
+    return resolved.get('account'), resolved.get('name'), resolved.get('ifsc')
+
+def _print_missing_columns(columns):
+    print("Error: Required columns not found in Excel file")
+    print(f"Available columns: {', '.join(columns)}")
+    print("\nRequired columns (flexible naming):")
+    print("  - Account Number (or similar)")
+    print("  - Account Name (or similar)")
+    print("  - IFSC (or similar)")
+
+def _cell_text(row, idx):
+    value = row[idx] if idx < len(row) else None
+    return '' if value is None else str(value).strip()
+
+def _group_rows(rows, account_idx, name_idx, ifsc_idx):
+    """Validate and group raw rows by IFSC code in a single pass"""
+    grouped = {}
+    invalid_ifsc = []
+    # IFSC values repeat heavily, so each distinct raw value is normalized and
+    # validated once and then maps straight to its group (None when invalid)
+    categories = {}
+    for row in rows:
+        raw = row[ifsc_idx] if ifsc_idx < len(row) else None
+        key = raw if type(raw) is str else (type(raw), raw)
+        category = categories.get(key)
+        if category is None:
+            ifsc = _cell_text(row, ifsc_idx).upper()
+            group = None
+            if validate_ifsc(ifsc):
+                group = grouped.get(ifsc)
+                if group is None:
+                    grouped[ifsc] = group = []
+            categories[key] = category = (ifsc, group)
+        ifsc, group = category
+        if group is None:
+            invalid_ifsc.append(ifsc)
+            continue
+        group.append({
+            'account_no': _cell_text(row, account_idx),
+            'account_name': _cell_text(row, name_idx),
+            'ifsc': ifsc
+        })
+    return grouped, invalid_ifsc
 
 def read_excel_data(excel_file):
     """Read and group data from Excel or CSV by IFSC code"""
     try:
         if excel_file.lower().endswith('.csv'):
-            df = pd.read_csv(excel_file)
+            # Stream CSV rows straight into the groups
+            with open(excel_file, newline='', encoding='utf-8-sig') as f:
+                reader = csv.reader(f)
+                columns = [c.strip() for c in next(reader, [])]
+                cols = _detect_columns(columns)
+                if not all(cols):
+                    _print_missing_columns(columns)
+                    return None
+                indices = [columns.index(c) for c in cols]
+                grouped, invalid_ifsc = _group_rows((row for row in reader if row), *indices)
         else:
-            df = pd.read_excel(excel_file)
-        
-        # Check required columns (case-insensitive)
-        df.columns = df.columns.str.strip()
-        
-        # Try to find columns with flexible naming
-        account_col = None
-        name_col = None
-        ifsc_col = None
-        
-        for col in df.columns:
-            col_lower = col.lower()
-            if (
-                (
-                    'account' in col_lower and (
-                        'number' in col_lower or 'no' in col_lower or '#' in col_lower
-                    )
+            # Stream the first worksheet; only three columns are ever kept
+            from openpyxl import load_workbook
+            wb = load_workbook(excel_file, read_only=True, data_only=True)
+            try:
+                rows = wb.worksheets[0].iter_rows(values_only=True)
+                columns = ['' if c is None else str(c).strip() for c in next(rows, ())]
+                cols = _detect_columns(columns)
+                if not all(cols):
+                    _print_missing_columns(columns)
+                    return None
+                indices = [columns.index(c) for c in cols]
+                grouped, invalid_ifsc = _group_rows(
+                    (row for row in rows if any(v is not None for v in row)), *indices
                 )
-                or ('a/c' in col_lower or 'ac no' in col_lower or 'acc no' in col_lower or 'acno' in col_lower)
-            ) and 'name' not in col_lower:
-                account_col = account_col or col
-            elif (
-                ('account' in col_lower and 'name' in col_lower)
-                or ('name' in col_lower and ('beneficiary' in col_lower or 'holder' in col_lower))
-                or ('account' in col_lower and 'holder' in col_lower)
-            ):
-                name_col = name_col or col
-            elif 'ifsc' in col_lower:
-                ifsc_col = ifsc_col or col
-        
-        if not all([account_col, name_col, ifsc_col]):
-            print("Error: Required columns not found in Excel file")
-            print(f"Available columns: {', '.join(df.columns)}")
-            print("\nRequired columns (flexible naming):")
-            print("  - Account Number (or similar)")
-            print("  - Account Name (or similar)")
-            print("  - IFSC (or similar)")
-            return None
-        
-        # Group by IFSC code
-        grouped = defaultdict(list)
-        invalid_ifsc = []
-        
-        for _, row in df.iterrows():
-            ifsc = str(row[ifsc_col]).strip().upper()
-            
-            # Validate IFSC format
-            if not validate_ifsc(ifsc):
-                invalid_ifsc.append(ifsc)
-                continue
-            
-            grouped[ifsc].append({
-                'account_no': str(row[account_col]).strip(),
-                'account_name': str(row[name_col]).strip(),
-                'ifsc': ifsc
-            })
+            finally:
+                wb.close()
         
         if invalid_ifsc:
             print(f"\n⚠ Warning: Found {len(invalid_ifsc)} invalid IFSC codes (skipped):")
@@ -210,6 +227,41 @@ def read_excel_data(excel_file):
         print(f"Error reading Excel file: {e}")
         return None
 
+_DOCX_LOADED = False
+
+def _load_docx():
+    """Import python-docx and lxml on first use so --help and argument checks stay fast"""
+    global _DOCX_LOADED, Document, Pt, RGBColor, OxmlElement, qn, Paragraph, PackageWriter
+    global WD_ALIGN_PARAGRAPH, WD_TABLE_ALIGNMENT, WD_ALIGN_VERTICAL, WD_ROW_HEIGHT_RULE, etree
+    if _DOCX_LOADED:
+        return
+    from docx import Document
+    from docx.shared import Pt
+    from docx.shared import RGBColor
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+    from docx.text.paragraph import Paragraph
+    from docx.opc.pkgwriter import PackageWriter
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.enum.table import WD_TABLE_ALIGNMENT, WD_ALIGN_VERTICAL, WD_ROW_HEIGHT_RULE
+    from lxml import etree
+    _DOCX_LOADED = True
+
+# WordprocessingML names in Clark notation (what qn() returns), spelled out so
+# module constants need no python-docx import
+_W_NS = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+_W = '{%s}' % _W_NS['w']
+_W_VAL = _W + 'val'
+_W_SZ = _W + 'sz'
+_W_SPACE = _W + 'space'
+_W_COLOR = _W + 'color'
+_W_W = _W + 'w'
+_W_TYPE = _W + 'type'
+_W_P = _W + 'p'
+_W_R = _W + 'r'
+_W_T = _W + 't'
+_W_TR = _W + 'tr'
+
 def _set_table_borders(table):
     tbl = table._tbl
     tblPr = tbl.tblPr
@@ -226,40 +278,70 @@ def _set_table_borders(table):
         borders.append(el)
     tblPr.append(borders)
 
-def _set_cell_borders(cell):
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
+# Canonical cell property fragments, built once and cloned per cell
+@functools.lru_cache(maxsize=None)
+def _cell_borders_template():
     borders = OxmlElement('w:tcBorders')
     for edge in ['top', 'left', 'bottom', 'right']:
         el = OxmlElement(f'w:{edge}')
-        el.set(qn('w:val'), 'single')
-        el.set(qn('w:sz'), '8')
-        el.set(qn('w:space'), '0')
-        el.set(qn('w:color'), '000000')
+        el.set(_W_VAL, 'single')
+        el.set(_W_SZ, '8')
+        el.set(_W_SPACE, '0')
+        el.set(_W_COLOR, '000000')
         borders.append(el)
-    tcPr.append(borders)
+    return borders
+
+@functools.lru_cache(maxsize=None)
+def _cell_margins_template(top, left, bottom, right):
+    tcMar = OxmlElement('w:tcMar')
+    for side, val in [('top', top), ('left', left), ('bottom', bottom), ('right', right)]:
+        el = OxmlElement(f'w:{side}')
+        el.set(_W_W, str(val))
+        el.set(_W_TYPE, 'dxa')
+        tcMar.append(el)
+    return tcMar
+
+def _set_cell_borders(cell):
+    tcPr = cell._tc.get_or_add_tcPr()
+    tcPr.append(copy.deepcopy(_cell_borders_template()))
+
+@functools.lru_cache(maxsize=None)
+def _paragraph_run_texts():
+    # The runs Paragraph.text reads: direct and hyperlink runs, not content
+    # controls, tracked insertions or textboxes nested in the paragraph
+    return etree.XPath('./w:r/w:t | ./w:hyperlink/w:r/w:t', namespaces=_W_NS)
+
+def _element_text(p):
+    """Lowercased text of a w:p element, from the same runs as Paragraph.text"""
+    return ''.join(t.text or '' for t in _paragraph_run_texts()(p)).lower()
 
-def _detect_tone(doc):
-    text = ' '.join(p.text.lower() for p in doc.paragraphs)
+def _paragraph_texts(doc):
+    """Return (w:p element, lowercased text) for each top-level body paragraph"""
+    return [(p, _element_text(p)) for p in doc.element.body.iterchildren(_W_P)]
+
+def _detect_tone(text):
     if any(k in text for k in ['urgent', 'immediate', 'final notice', 'last reminder']):
         return 'urgent'
     if any(k in text for k in ['kindly', 'please', 'request', 'cooperate']):
         return 'friendly'
     return 'formal'
 
-def _apply_tone(doc, tone, font_name_override=None, font_size_override=None):
+def _apply_tone(doc, tone, font_name_override=None, font_size_override=None, paragraph_texts=None):
+    if paragraph_texts is None:
+        paragraph_texts = _paragraph_texts(doc)
     if tone == 'auto':
-        tone = _detect_tone(doc)
+        tone = _detect_tone(' '.join(text for _, text in paragraph_texts))
     if tone not in ['formal', 'urgent', 'friendly']:
         tone = 'formal'
     font_name = font_name_override
     font_size = font_size_override
-    for p in doc.paragraphs:
+    for p_el, text in paragraph_texts:
+        p = Paragraph(p_el, doc._body)
         if font_name and font_size:
             for r in p.runs:
                 r.font.name = font_name
                 r.font.size = Pt(font_size)
-        if tone == 'urgent' and any(k in p.text.lower() for k in ['notice', 'urgent']):
+        if tone == 'urgent' and any(k in text for k in ['notice', 'urgent']):
             for r in p.runs:
                 r.bold = True
                 r.font.color.rgb = RGBColor(0x99, 0x00, 0x00)
@@ -271,30 +353,41 @@ def _apply_tone(doc, tone, font_name_override=None, font_size_override=None):
                 cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
 
 def _set_cell_margins(cell, top=36, left=36, bottom=36, right=36):
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    tcMar = OxmlElement('w:tcMar')
-    for side, val in [('top', top), ('left', left), ('bottom', bottom), ('right', right)]:
-        el = OxmlElement(f'w:{side}')
-        el.set(qn('w:w'), str(val))
-        el.set(qn('w:type'), 'dxa')
-        tcMar.append(el)
-    tcPr.append(tcMar)
+    tcPr = cell._tc.get_or_add_tcPr()
+    tcPr.append(copy.deepcopy(_cell_margins_template(top, left, bottom, right)))
 
 def _apply_paragraph_style(paragraphs, font_name, font_size, spacing):
     for p in paragraphs:
         for r in p.runs:
             r.font.name = font_name
             r.font.size = Pt(font_size)
+    _apply_paragraph_spacing(paragraphs, spacing)
+
+def _apply_paragraph_spacing(paragraphs, spacing):
+    if spacing is None:
+        return
+    sb, sa, ls = spacing
+    for p in paragraphs:
         pf = p.paragraph_format
-        if spacing is not None:
-            sb, sa, ls = spacing
-            if sb is not None:
-                pf.space_before = sb
-            if sa is not None:
-                pf.space_after = sa
-            if ls is not None:
-                pf.line_spacing = ls
+        if sb is not None:
+            pf.space_before = sb
+        if sa is not None:
+            pf.space_after = sa
+        if ls is not None:
+            pf.line_spacing = ls
+
+@functools.lru_cache(maxsize=16)
+def _run_properties(font_name, font_size):
+    """Canonical <w:rPr> for a font; deepcopy it before inserting into a run"""
+    rPr = OxmlElement('w:rPr')
+    rFonts = OxmlElement('w:rFonts')
+    rFonts.set(qn('w:ascii'), font_name)
+    rFonts.set(qn('w:hAnsi'), font_name)
+    rPr.append(rFonts)
+    sz = OxmlElement('w:sz')
+    sz.set(_W_VAL, str(int(Pt(font_size).pt * 2)))  # half-points
+    rPr.append(sz)
+    return rPr
 
 def _get_cell_width(cell):
     tcPr = cell._tc.get_or_add_tcPr()
@@ -366,10 +459,11 @@ def _extract_nodal_baseline(doc, fallback_font, fallback_size):
     font_name = None
     font_size = None
     bold = None
-    for i, p in enumerate(doc.paragraphs):
+    paragraphs = doc.paragraphs
+    for i, p in enumerate(paragraphs):
         if 'nodal officer' in p.text.lower():
-            if i + 1 < len(doc.paragraphs):
-                np = doc.paragraphs[i + 1]
+            if i + 1 < len(paragraphs):
+                np = paragraphs[i + 1]
                 try:
                     style_name = np.style.name if np.style else None
                 except Exception:
@@ -439,88 +533,218 @@ def _apply_baseline_to_paragraph(paragraph, text, baseline, doc):
         if baseline.get('bold') is not None:
             r.bold = baseline['bold']
 
-def update_word_template(template_file, output_file, bank_name, accounts, placeholder='ICICI BANK', tone='formal', font_name='Bookman Old Style', font_size=8):
-    """Update Word template with bank name and accounts table"""
+@functools.lru_cache(maxsize=None)
+def _paragraphs_containing():
+    return etree.XPath('.//w:p[contains(string(.), $text)]', namespaces=_W_NS)
+
+def _replace_placeholder(doc, placeholder, replacement):
+    """Replace placeholder text in place, keeping run formatting where possible"""
+    if not placeholder:
+        return
+    for p in _paragraphs_containing()(doc.element.body, text=placeholder):
+        texts = [t for t in p.iter(_W_T) if t.text]
+        full_text = ''.join(t.text for t in texts)
+        if sum(t.text.count(placeholder) for t in texts) < full_text.count(placeholder):
+            # Placeholder is split across runs; rewrite the paragraph as one run
+            paragraph = Paragraph(p, None)
+            paragraph.text = paragraph.text.replace(placeholder, replacement)
+            continue
+        for t in texts:
+            if placeholder in t.text:
+                t.text = t.text.replace(placeholder, replacement)
+
+# Template style baselines keyed by (template content hash, fallback font, fallback size)
+_BASELINE_CACHE = {}
+
+def _template_baselines(template_bytes, font_name='Bookman Old Style', font_size=8):
+    """Extract the table and nodal-officer baselines once per distinct template"""
+    _load_docx()
+    key = (hashlib.sha1(template_bytes).hexdigest(), font_name, font_size)
+    if key not in _BASELINE_CACHE:
+        doc = Document(BytesIO(template_bytes))
+        baseline = _extract_template_baseline(doc, font_name, font_size)
+        # The nodal baseline has always been read after _apply_tone, which
+        # left-aligns every body paragraph; keep that for the bank-name lines
+        _apply_tone(doc, 'formal')
+        nodal_baseline = _extract_nodal_baseline(doc, baseline[0], baseline[1])
+        _BASELINE_CACHE[key] = (baseline, nodal_baseline)
+    return _BASELINE_CACHE[key]
+
+def _load_template(template_file, font_name='Bookman Old Style', font_size=8):
+    """Read the template bytes and return them with their cached style baselines"""
+    with open(template_file, 'rb') as f:
+        template_bytes = f.read()
+    baseline, nodal_baseline = _template_baselines(template_bytes, font_name, font_size)
+    return template_bytes, baseline, nodal_baseline
+
+def _build_account_row_template(table, baseline):
+    """Build one fully styled, empty data row and detach it for cloning"""
+    tmpl_font, tmpl_size, header_widths, header_row_height, header_spacing = baseline
+    row = table.add_row()
+    rPr = _run_properties(tmpl_font, tmpl_size)
+    for cell in row.cells:
+        cell.text = ''
+        for r in cell._tc.iter(_W_R):
+            r.insert(0, copy.deepcopy(rPr))
+        _apply_paragraph_spacing(cell.paragraphs, header_spacing)
+        _set_cell_borders(cell)
+        _set_cell_margins(cell, 36, 36, 36, 36)
+    if header_widths:
+        for idx, cell in enumerate(row.cells):
+            _set_cell_width(cell, header_widths[idx] if idx < len(header_widths) else None)
+    row.height_rule = WD_ROW_HEIGHT_RULE.AT_LEAST
+    row.height = header_row_height or Pt(tmpl_size + 6)
+    table._tbl.remove(row._tr)
+    return row._tr
+
+def _fill_accounts_table(table, accounts, baseline):
+    """Style the header row and replace the data rows with one row per account"""
+    tmpl_font, tmpl_size, header_widths, header_row_height, header_spacing = baseline
+    header_row = table.rows[0]
+    for cell in header_row.cells:
+        _apply_paragraph_style(cell.paragraphs, tmpl_font, tmpl_size, header_spacing)
+        for p in cell.paragraphs:
+            for r in p.runs:
+                r.bold = True
+        _set_cell_margins(cell, 36, 36, 36, 36)
+    header_row.height_rule = WD_ROW_HEIGHT_RULE.AT_LEAST
+    header_row.height = header_row_height or Pt(tmpl_size + 6)
+    tbl = table._tbl
+    for tr in tbl.findall(_W_TR)[1:]:
+        tbl.remove(tr)
+    if accounts:
+        row_template = _build_account_row_template(table, baseline)
+        for account in accounts:
+            tr = copy.deepcopy(row_template)
+            values = (account['account_no'], account['account_name'], account['ifsc'])
+            for r, value in zip(tr.iter(_W_R), values):
+                r.text = value
+            tbl.append(tr)
     try:
-        doc = Document(template_file)
-        tmpl_font, tmpl_size, header_widths, header_row_height, header_spacing = _extract_template_baseline(doc, font_name, font_size)
-        _apply_tone(doc, tone)  # do not override template fonts globally
-        
-        # Update bank name in the document
-        # Search in paragraphs
-        for paragraph in doc.paragraphs:
-            if placeholder in paragraph.text:
-                paragraph.text = paragraph.text.replace(placeholder, bank_name)
+        table.style = 'Table Grid'
+    except Exception:
+        pass
+    _set_table_borders(table)
+
+# Output zip settings: tiny parts (rels, props) are stored as-is and the rest
+# use a light deflate level, which saves far faster than the default level 6
+_ZIP_STORE_MAX_BYTES = 1024
+_ZIP_DEFLATE_LEVEL = 3
+
+class _DocxZipWriter:
+    """Physical package writer for python-docx that skips deflate on tiny parts"""
+
+    def __init__(self, pkg_file):
+        self._zipf = zipfile.ZipFile(pkg_file, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=_ZIP_DEFLATE_LEVEL)
+
+    def write(self, pack_uri, blob):
+        compress_type = zipfile.ZIP_STORED if len(blob) <= _ZIP_STORE_MAX_BYTES else zipfile.ZIP_DEFLATED
+        self._zipf.writestr(pack_uri.membername, blob, compress_type=compress_type)
+
+    def close(self):
+        self._zipf.close()
+
+def _save_docx(doc, output_file):
+    """Save doc like Document.save(), but through _DocxZipWriter"""
+    # Mirrors PackageWriter.write() using its private helpers, which is why
+    # requirements.txt pins python-docx==1.2.0; recheck this on any upgrade
+    package = doc.part.package
+    # Each package.parts walks the whole relationship graph; do it once
+    parts = package.parts
+    for part in parts:
+        part.before_marshal()
+    writer = _DocxZipWriter(output_file)
+    try:
+        PackageWriter._write_content_types_stream(writer, parts)
+        PackageWriter._write_pkg_rels(writer, package.rels)
+        PackageWriter._write_parts(writer, parts)
+    finally:
+        writer.close()
+
+def update_word_template(template_file, output_file, bank_name, accounts, placeholder='ICICI BANK', tone='formal', font_name='Bookman Old Style', font_size=8, baseline=None, nodal_baseline=None):
+    """Update Word template with bank name and accounts table
+
+    template_file may be a path, a file-like object or the raw template bytes;
+    output_file may be a path or a writable stream; baseline and
+    nodal_baseline default to the cached _template_baselines() for the template
+    """
+    _load_docx()
+    try:
+        if isinstance(template_file, bytes):
+            template_bytes = template_file
+        elif hasattr(template_file, 'read'):
+            template_bytes = template_file.read()
+        else:
+            with open(template_file, 'rb') as f:
+                template_bytes = f.read()
+        if baseline is None or nodal_baseline is None:
+            cached_baseline, cached_nodal = _template_baselines(template_bytes, font_name, font_size)
+            baseline = baseline or cached_baseline
+            nodal_baseline = nodal_baseline or cached_nodal
+        doc = Document(BytesIO(template_bytes))
+        paragraph_texts = _paragraph_texts(doc)
+        _apply_tone(doc, tone, paragraph_texts=paragraph_texts)  # do not override template fonts globally
         
-        # Search in tables (headers, etc.)
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for paragraph in cell.paragraphs:
-                        if placeholder in paragraph.text:
-                            paragraph.text = paragraph.text.replace(placeholder, bank_name)
+        # Update bank name everywhere in the body (paragraphs and tables)
+        _replace_placeholder(doc, placeholder, bank_name)
         
-        # Find and update the accounts table (table with 3 columns)
-        for table in doc.tables:
-            if len(table.columns) == 3:
-                header_text = ''.join([cell.text for cell in table.rows[0].cells]).lower()
-                if 'account' in header_text and 'ifsc' in header_text:
-                    header_row = table.rows[0]
-                    for cell in header_row.cells:
-                        _apply_paragraph_style(cell.paragraphs, tmpl_font, tmpl_size, header_spacing)
-                        for p in cell.paragraphs:
-                            for r in p.runs:
-                                r.bold = True
-                        _set_cell_margins(cell, 36, 36, 36, 36)
-                    header_row.height_rule = WD_ROW_HEIGHT_RULE.AT_LEAST
-                    header_row.height = header_row_height or Pt(tmpl_size + 6)
-                    rows_to_delete = len(table.rows) - 1
-                    for _ in range(rows_to_delete):
-                        table._element.remove(table.rows[-1]._element)
-                    for account in accounts:
-                        row = table.add_row()
-                        row.cells[0].text = account['account_no']
-                        row.cells[1].text = account['account_name']
-                        row.cells[2].text = account['ifsc']
-                        for cell in row.cells:
-                            _apply_paragraph_style(cell.paragraphs, tmpl_font, tmpl_size, header_spacing)
-                            _set_cell_borders(cell)
-                            _set_cell_margins(cell, 36, 36, 36, 36)
-                        if header_widths:
-                            for idx, cell in enumerate(row.cells):
-                                _set_cell_width(cell, header_widths[idx] if idx < len(header_widths) else None)
-                        row.height_rule = WD_ROW_HEIGHT_RULE.AT_LEAST
-                        row.height = header_row_height or Pt(tmpl_size + 6)
-                    try:
-                        table.style = 'Table Grid'
-                    except Exception:
-                        pass
-                    _set_table_borders(table)
-                    break
-
-        nodal_baseline = _extract_nodal_baseline(doc, tmpl_font, tmpl_size)
-        for i, paragraph in enumerate(doc.paragraphs):
-            if 'nodal officer' in paragraph.text.lower():
-                if i + 1 < len(doc.paragraphs):
-                    next_p = doc.paragraphs[i + 1]
+        for i, (p_el, text) in enumerate(paragraph_texts):
+            # The cached text predates the placeholder swap and earlier rewrites
+            # (a paragraph just set to the bank name), so re-check candidates live
+            if 'nodal officer' in text and 'nodal officer' in _element_text(p_el):
+                if i + 1 < len(paragraph_texts):
+                    next_p = Paragraph(paragraph_texts[i + 1][0], doc._body)
                     _apply_baseline_to_paragraph(next_p, bank_name, nodal_baseline, doc)
 
+        # Single pass over tables: fill the accounts table (3 columns with an
+        # account/IFSC header) and place the bank name below "NODAL OFFICER" cells
+        accounts_table_done = False
         for table in doc.tables:
-            for r_idx, row in enumerate(table.rows):
+            rows = list(table.rows)
+            if not accounts_table_done and len(table.columns) == 3:
+                header_text = ''.join([cell.text for cell in rows[0].cells]).lower()
+                if 'account' in header_text and 'ifsc' in header_text:
+                    _fill_accounts_table(table, accounts, baseline)
+                    accounts_table_done = True
+                    continue
+            for r_idx, row in enumerate(rows):
                 for c_idx, cell in enumerate(row.cells):
                     if 'nodal officer' in cell.text.lower():
-                        if r_idx + 1 < len(table.rows):
+                        if r_idx + 1 < len(rows):
                             target_cell = table.cell(r_idx + 1, c_idx)
                             for p in target_cell.paragraphs:
                                 _apply_baseline_to_paragraph(p, bank_name, nodal_baseline, doc)
         
         # Save the document
-        doc.save(output_file)
+        _save_docx(doc, output_file)
         return True
     except Exception as e:
         print(f"Error updating Word template: {e}")
         return False
 
+def _render_notice(template_bytes, bank_name, accounts, placeholder, tone, font_name, font_size, *, baseline, nodal_baseline):
+    """Build one notice in memory; returns the .docx bytes, or None on failure"""
+    buffer = BytesIO()
+    if update_word_template(template_bytes, buffer, bank_name, accounts, placeholder, tone, font_name, font_size, baseline=baseline, nodal_baseline=nodal_baseline):
+        return buffer.getvalue()
+    return None
+
+# Writes are short, GIL-releasing file I/O, so a few threads keep up with
+# every build process; more would only contend for the same disk
+_WRITER_THREADS = 4
+
+def _write_notice(output_file, data):
+    """Write the bytes of a finished notice build to output_file"""
+    if data is None:
+        return False
+    try:
+        with open(output_file, 'wb') as f:
+            f.write(data)
+        return True
+    except OSError as e:
+        print(f"Error saving notice: {e}")
+        return False
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate bank notices from Excel file and Word template',
@@ -565,19 +789,53 @@ def main():
     print(f"📊 Total accounts: {total_accounts}")
     print(f"\n🔨 Generating notices...\n")
     
-    # Generate notice for each IFSC group
+    # Parse the template once; every group starts from the same bytes
+    try:
+        template_bytes, baseline, nodal_baseline = _load_template(args.template_file, args.font_name, args.font_size)
+    except Exception as e:
+        print(f"❌ Error: Could not read template file '{args.template_file}': {e}")
+        return
+    
+    # Build notices in parallel processes (each IFSC group is independent) and
+    # write the finished bytes from a thread pool as soon as each build is done
     success_count = 0
-    for ifsc, accounts in grouped_data.items():
-        bank_name = get_bank_name(ifsc)
-        output_file = os.path.join(args.output_dir, f"Notice_{bank_name.replace(' ', '_')}_{ifsc}.docx")
-        
-        print(f"  📄 {bank_name} ({ifsc}) - {len(accounts)} account(s)")
-        
-        if update_word_template(args.template_file, output_file, bank_name, accounts, args.placeholder, args.tone, args.font_name, args.font_size):
-            print(f"     ✅ Saved: {output_file}")
-            success_count += 1
-        else:
-            print(f"     ❌ Failed")
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+    with ProcessPoolExecutor() as builders, ThreadPoolExecutor(max_workers=_WRITER_THREADS) as writers:
+        try:
+            builds = {}
+            jobs = []
+            for ifsc, accounts in grouped_data.items():
+                bank_name = get_bank_name(ifsc)
+                output_file = os.path.join(args.output_dir, f"Notice_{_safe_bank_token(bank_name)}_{ifsc}.docx")
+                build = builders.submit(_render_notice, template_bytes, bank_name, accounts, args.placeholder, args.tone, args.font_name, args.font_size, baseline=baseline, nodal_baseline=nodal_baseline)
+                builds[build] = output_file
+                jobs.append((build, ifsc, bank_name, len(accounts), output_file))
+            
+            # Hand each build to a writer as it finishes, so a slow early build
+            # never holds up writing the ones completed after it; a build that
+            # raised is kept as-is and reported below
+            writes = {}
+            for build in as_completed(builds):
+                writes[build] = build if build.exception() else writers.submit(_write_notice, builds[build], build.result())
+            
+            # Report in input order so the log stays stable across runs
+            for build, ifsc, bank_name, count, output_file in jobs:
+                print(f"  📄 {bank_name} ({ifsc}) - {count} account(s)")
+                try:
+                    ok = writes[build].result()
+                except Exception as e:
+                    print(f"Error updating Word template: {e}")
+                    ok = False
+                if ok:
+                    print(f"     ✅ Saved: {output_file}")
+                    success_count += 1
+                else:
+                    print(f"     ❌ Failed")
+        except BaseException:
+            # Ctrl-C or an unexpected error: drop queued builds instead of
+            # running them all on the way out of the executor
+            builders.shutdown(cancel_futures=True)
+            raise
     
     print(f"\n{'='*60}")
     print(f"✅ Done! Generated {success_count}/{len(grouped_data)} notices")
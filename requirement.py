@@ -3,7 +3,6 @@ import subprocess
 import argparse
 
 REQUIRED = [
-    {"pip": "pandas", "import": "pandas"},
     {"pip": "openpyxl", "import": "openpyxl"},
     {"pip": "python-docx", "import": "docx"},
 ]